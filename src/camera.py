@@ -2,7 +2,7 @@
 """
 Defines the Camera class for managing the game's viewport.
 """
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import pygame
 
@@ -28,6 +28,9 @@ class Camera:
         self.screen_center = pygame.math.Vector2(width / 2, height / 2)
 
         self.zoom_state = ZoomState()
+        # The visible world bounds are memoized until the camera moves, zooms or resizes.
+        self._bounds_key: Optional[Tuple[float, float, float, int, int]] = None
+        self._bounds: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
 
     def screen_to_world(self, screen_pos: Tuple[int, int]) -> pygame.math.Vector2:
         """Converts screen coordinates to world coordinates."""
@@ -41,6 +44,17 @@ class Camera:
         screen_offset *= self.zoom_state.current
         return screen_offset + self.screen_center
 
+    def get_visible_world_bounds(self) -> Tuple[float, float, float, float]:
+        """Returns the (left, top, right, bottom) world coordinates of the visible area."""
+        zoom = self.zoom_state.current
+        key = (self.position.x, self.position.y, zoom, self.width, self.height)
+        if key != self._bounds_key:
+            left = self.position.x - self.screen_center.x / zoom
+            top = self.position.y - self.screen_center.y / zoom
+            self._bounds = (left, top, left + self.width / zoom, top + self.height / zoom)
+            self._bounds_key = key
+        return self._bounds
+
     def apply(self, rect: pygame.Rect) -> pygame.Rect:
         """Applies camera transformation to a pygame.Rect."""
         top_left = self.world_to_screen(rect.topleft)
@@ -6,7 +6,7 @@ from __future__ import annotations
 import os
 import random
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pygame
 import settings
@@ -16,18 +16,44 @@ import globe_renderer
 from map import Map
 from unit import Unit
 
+# SysFont does a system font lookup, so each (name, size) font is created once and shared.
+_FONT_CACHE: Dict[Tuple[str, int], pygame.font.Font] = {}
+
+def _get_font(name: str, size: int) -> pygame.font.Font:
+    """Returns a shared system font, creating it on first use."""
+    font = _FONT_CACHE.get((name, size))
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        _FONT_CACHE[(name, size)] = font
+    return font
+
+def _menu_item_at(rects: List[pygame.Rect], pos: Tuple[int, int]) -> int:
+    """
+    Returns the index of the menu item under pos, or -1 if there is none.
+    The scan is done in C by Rect.collidelist using a 1x1 probe rect.
+    """
+    return pygame.Rect(pos, (1, 1)).collidelist(rects)
+
 class SubMenuState:
     """Encapsulates the state of a context sub-menu."""
     # pylint: disable=too-few-public-methods
+    __slots__ = ("active", "options", "rects", "label_blits", "panel_rect", "parent_rect")
     def __init__(self) -> None:
         self.active: bool = False
         self.options: List[str] = []
         self.rects: List[pygame.Rect] = []
+        # (label surface, position) pairs, laid out once when the menu opens.
+        self.label_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self.panel_rect: Optional[pygame.Rect] = None  # Bounding box of all item rects
         self.parent_rect: Optional[pygame.Rect] = None
 
 class ContextMenuState:
     """Encapsulates the state of the right-click context menu."""
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    __slots__ = (
+        "active", "pos", "options", "rects", "label_blits", "target_tile", "font", "sub_menu",
+        "hover_pos", "panel_rect"
+    )
     def __init__(self) -> None:
         self.active: bool = False
         self.pos: Optional[Tuple[int, int]] = None
@@ -37,13 +63,22 @@ class ContextMenuState:
             {"label": "MoveTo"},
         ]
         self.rects: List[pygame.Rect] = []
+        # (label surface, position) pairs, laid out once when the menu opens.
+        self.label_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
         self.target_tile: Optional[Tuple[int, int]] = None
-        self.font = pygame.font.SysFont("Arial", settings.CONTEXT_MENU_FONT_SIZE)
+        self.font = _get_font("Arial", settings.CONTEXT_MENU_FONT_SIZE)
         self.sub_menu = SubMenuState()
+        # The mouse position the hover state was last resolved for.
+        self.hover_pos: Optional[Tuple[int, int]] = None
+        self.panel_rect: Optional[pygame.Rect] = None  # Bounding box of all item rects
 
 class WorldState:
     """Encapsulates the state of all game objects and player interaction."""
     # pylint: disable=too-few-public-methods
+    __slots__ = (
+        "units", "selected_units", "hovered_tile", "left_mouse_down_pos",
+        "right_mouse_down_pos", "selection_box", "context_menu"
+    )
     def __init__(self) -> None:
         self.units: List[Unit] = []
         self.selected_units: List[Unit] = []
@@ -55,21 +90,49 @@ class WorldState:
 
 class GlobeState:
     """Encapsulates the state of the globe animation popup."""
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    __slots__ = (
+        "is_showing", "frames", "frame_count", "frame_index", "animation_timer",
+        "panel_surface", "overlay_surface", "layout_key", "popup_rect", "frame_pos"
+    )
     def __init__(self) -> None:
         self.is_showing: bool = False
         self.frames: List[pygame.Surface] = []
+        self.frame_count: int = 0  # len(frames), cached when the frames are loaded
         self.frame_index: int = 0
         self.animation_timer: float = 0.0
+        # The popup background and border, pre-drawn once for the current frame size.
+        self.panel_surface: Optional[pygame.Surface] = None
+        # The full-screen dimming overlay, rebuilt only when the window size changes.
+        self.overlay_surface: Optional[pygame.Surface] = None
+        # Popup placement, recomputed only when the screen or frame size changes.
+        self.layout_key: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None
+        self.popup_rect = pygame.Rect(0, 0, 0, 0)
+        self.frame_pos: Tuple[int, int] = (0, 0)
 
 class DebugPanel:
     """Handles rendering and interaction for the top debug panel."""
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "font", "exit_text_surface", "new_text_surface", "globe_text_surface",
+        "info_string", "info_surface", "exit_link_rect", "new_link_rect", "show_globe_link_rect"
+    )
     def __init__(self) -> None:
-        self.font = pygame.font.SysFont("Arial", settings.DEBUG_PANEL_FONT_SIZE)
+        self.font = _get_font("Arial", settings.DEBUG_PANEL_FONT_SIZE)
+        # The link labels never change, so render them once up front.
+        self.exit_text_surface = self._render_link("Exit")
+        self.new_text_surface = self._render_link("New")
+        self.globe_text_surface = self._render_link("Show Globe")
+        self.info_string: str = ""
+        self.info_surface: Optional[pygame.Surface] = None
         self.exit_link_rect: Optional[pygame.Rect] = None
         self.new_link_rect: Optional[pygame.Rect] = None
         self.show_globe_link_rect: Optional[pygame.Rect] = None
 
+    def _render_link(self, text: str) -> pygame.Surface:
+        """Renders a link label, converted to the display's pixel format for fast blits."""
+        return self.font.render(text, True, settings.DEBUG_PANEL_FONT_COLOR).convert_alpha()
+
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         """
         Handles events for the debug panel.
@@ -86,7 +149,7 @@ class DebugPanel:
 
     def _draw_main_info(self, game: Game) -> None:
         """Draws the main informational text (FPS, zoom, etc.)."""
-        world_pos = game.camera.screen_to_world(pygame.mouse.get_pos())
+        world_pos = game.camera.screen_to_world(game.mouse_pos)
         world_coords = f"({int(world_pos.x)}, {int(world_pos.y)})"
         zoom_percentage = game.camera.zoom_state.current * 100
         info_string = (
@@ -100,22 +163,27 @@ class DebugPanel:
             tile_info = f"({tile_x}, {tile_y}) ({terrain.capitalize()})"
             info_string += f" | Tile: {tile_info}"
 
-        text_surface = self.font.render(
-            info_string, True, settings.DEBUG_PANEL_FONT_COLOR
-        )
+        # The info text only changes when the FPS, zoom or cursor does, so only
+        # re-render it when the string differs from the last frame's.
+        if info_string != self.info_string:
+            self.info_string = info_string
+            self.info_surface = self.font.render(
+                info_string, True, settings.DEBUG_PANEL_FONT_COLOR
+            ).convert_alpha()
+        text_surface = self.info_surface
         text_y = (settings.DEBUG_PANEL_HEIGHT - text_surface.get_height()) // 2
         game.screen.blit(text_surface, (10, text_y))
 
     def _draw_exit_link(self, game: Game) -> None:
         """Draws the clickable 'Exit' link."""
-        exit_text_surface = self.font.render("Exit", True, settings.DEBUG_PANEL_FONT_COLOR)
+        exit_text_surface = self.exit_text_surface
         exit_text_x = settings.SCREEN_WIDTH - exit_text_surface.get_width() - 10
         exit_text_y = (settings.DEBUG_PANEL_HEIGHT - exit_text_surface.get_height()) // 2
         self.exit_link_rect = game.screen.blit(exit_text_surface, (exit_text_x, exit_text_y))
 
     def _draw_new_link(self, game: Game) -> None:
         """Draws the clickable 'New' link."""
-        new_text_surface = self.font.render("New", True, settings.DEBUG_PANEL_FONT_COLOR)
+        new_text_surface = self.new_text_surface
         # Position it to the left of the exit link, which must be drawn first.
         exit_width = self.exit_link_rect.width if self.exit_link_rect else 0
         spacing = 15
@@ -126,7 +194,7 @@ class DebugPanel:
 
     def _draw_show_globe_link(self, game: Game) -> None:
         """Draws the clickable 'Show Globe' link."""
-        globe_text_surface = self.font.render("Show Globe", True, settings.DEBUG_PANEL_FONT_COLOR)
+        globe_text_surface = self.globe_text_surface
         # Position it to the left of the 'New' link, which must be drawn first.
         spacing = 15
         globe_text_x = self.new_link_rect.left - globe_text_surface.get_width() - spacing
@@ -154,6 +222,8 @@ class Game:
     """The main game class, orchestrating all game components."""
     def __init__(self) -> None:
         pygame.init()
+        # The game plays no sounds, so release the audio device pygame.init() opened.
+        pygame.mixer.quit()
 
         # Start with a resizable, maximized window if possible
         flags = pygame.RESIZABLE
@@ -172,9 +242,25 @@ class Game:
         settings.SCREEN_WIDTH = self.screen.get_width()
         settings.SCREEN_HEIGHT = self.screen.get_height()
 
+        # Only queue the event types the game actually handles; text input, touch,
+        # joystick and window chatter are dropped by SDL instead of piling up.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE, pygame.MOUSEWHEEL,
+            pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION
+        ])
+
         pygame.display.set_caption("WorldDom")
         self.clock = pygame.time.Clock()
         self.running: bool = True
+        self.mouse_pos: Tuple[int, int] = pygame.mouse.get_pos()
+        # Mouse position and camera view the hovered tile was last computed for.
+        self._hover_key: Optional[
+            Tuple[Tuple[int, int], float, float, float, int, int]
+        ] = None
+        # Rendered text keyed by (font, text, color); menu labels never change.
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]],
+                               pygame.Surface] = {}
 
         # --- Show Splash Screen ---
         # Draw a splash screen to give feedback to the user while the map,
@@ -204,6 +290,17 @@ class Game:
             self._draw_splash_screen(progress=progress)
         self._load_globe_frames(map_seed)
 
+    def _render_text(
+        self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Renders text with the given font and color, reusing a cached surface if possible."""
+        key = (font, text, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            text_surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = text_surface
+        return text_surface
+
     def _draw_splash_screen(self, progress: Optional[float] = None) -> None:
         """
         Displays a loading screen. If progress is provided, it also
@@ -211,9 +308,9 @@ class Game:
         """
         self.screen.fill(settings.DEBUG_PANEL_BG_COLOR)
 
-        font = pygame.font.SysFont("Arial", 48)
+        font = _get_font("Arial", 48)
         text = "Generating globe..." if progress is not None else "A new map is being created..."
-        text_surface = font.render(text, True, settings.DEBUG_PANEL_FONT_COLOR)
+        text_surface = self._render_text(font, text, settings.DEBUG_PANEL_FONT_COLOR)
         center_pos = (settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2)
         text_rect = text_surface.get_rect(center=center_pos)
         self.screen.blit(text_surface, text_rect)
@@ -249,6 +346,8 @@ class Game:
     def _load_globe_frames(self, map_seed: int) -> None:
         """Loads the pre-rendered globe animation frames from disk."""
         self.globe_state.frames.clear() # Clear frames from any previous map
+        self.globe_state.frame_count = 0
+        self.globe_state.frame_index = 0
         frame_dir = f"globe_frames_{map_seed}"
         if not os.path.isdir(frame_dir):
             print(f"Warning: Globe animation directory not found at '{frame_dir}'")
@@ -262,6 +361,7 @@ class Game:
                 full_path = os.path.join(frame_dir, f)
                 image = pygame.image.load(full_path).convert_alpha()
                 self.globe_state.frames.append(image)
+            self.globe_state.frame_count = len(self.globe_state.frames)
             print(f"Successfully loaded {len(self.globe_state.frames)} globe frames.")
         except pygame.error as e:
             print(f"Error loading globe frames: {e}")
@@ -297,6 +397,7 @@ class Game:
         map_seed = random.randint(0, 1_000_000)
         self.map = Map(settings.MAP_WIDTH_TILES, settings.MAP_HEIGHT_TILES, seed=map_seed)
         self.world_state = WorldState()
+        self._hover_key = None
 
         # 3. Spawn new unit and center camera
         initial_unit = self._spawn_initial_units()
@@ -314,9 +415,16 @@ class Game:
     def handle_events(self, events: List[pygame.event.Event]) -> None:
         """Processes all user input and events."""
         for event in events:
-            if event.type == pygame.QUIT:
+            event_type = event.type
+            # Mouse motion makes up most of the queue and only the motion handler
+            # cares about it, so dispatch it before the other checks.
+            if event_type == pygame.MOUSEMOTION:
+                self._handle_mouse_motion(event)
+                continue
+
+            if event_type == pygame.QUIT:
                 self.running = False
-            elif event.type == pygame.KEYDOWN:
+            elif event_type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     # If the globe popup is open, Escape should close it.
                     # Otherwise, it should exit the game.
@@ -324,7 +432,7 @@ class Game:
                         self.globe_state.is_showing = False
                     else:
                         self.running = False
-            elif event.type == pygame.VIDEORESIZE:
+            elif event_type == pygame.VIDEORESIZE:
                 current_flags = self.screen.get_flags()
                 self.screen = pygame.display.set_mode((event.w, event.h), current_flags)
                 settings.SCREEN_WIDTH = event.w
@@ -364,8 +472,6 @@ class Game:
             self._handle_mouse_button_down(event)
         elif event.type == pygame.MOUSEBUTTONUP:
             self._handle_mouse_button_up(event)
-        elif event.type == pygame.MOUSEMOTION:
-            self._handle_mouse_motion(event)
 
     def _handle_mouse_button_down(self, event: pygame.event.Event) -> None:
         """Handles mouse button down events."""
@@ -431,18 +537,43 @@ class Game:
         self.world_state.context_menu.active = True
         self.world_state.context_menu.pos = screen_pos
         self.world_state.context_menu.target_tile = self.world_state.hovered_tile
-        self.world_state.context_menu.rects.clear()
+        self.world_state.context_menu.hover_pos = None
 
         # Calculate rects for each option
-        x, y = screen_pos
+        labels = [option_data["label"] for option_data in self.world_state.context_menu.options]
+        self._set_menu_layout(self.world_state.context_menu, labels, screen_pos)
+
+    def _set_menu_layout(
+        self, menu: Union[ContextMenuState, SubMenuState],
+        labels: List[str], top_left: Tuple[int, int]
+    ) -> None:
+        """
+        Stacks the labels vertically from top_left and stores the resulting item
+        rects, draw items and panel bounding rect on the given menu state.
+        Each label is rendered exactly once and reused for both layout and drawing.
+        """
+        text_surfaces = [
+            self._render_text(
+                self.world_state.context_menu.font, label, settings.CONTEXT_MENU_TEXT_COLOR
+            )
+            for label in labels
+        ]
+        x, y = top_left
         padding = settings.CONTEXT_MENU_PADDING
-        for i, option_data in enumerate(self.world_state.context_menu.options):
-            option_text = option_data["label"]
-            text_surface = self.world_state.context_menu.font.render(option_text, True, (0, 0, 0))
+        menu.rects.clear()
+        menu.label_blits.clear()
+        max_width = 0
+        bottom = y
+        for i, text_surface in enumerate(text_surfaces):
             width = text_surface.get_width() + padding * 2
             height = text_surface.get_height() + padding
             rect = pygame.Rect(x, y + i * height, width, height)
-            self.world_state.context_menu.rects.append(rect)
+            menu.rects.append(rect)
+            menu.label_blits.append((text_surface, (x + padding, rect.y + padding // 2)))
+            max_width = max(max_width, width)
+            bottom = rect.bottom
+        # The items are stacked from (x, y), so the bounding box falls out of the loop.
+        menu.panel_rect = pygame.Rect(x, y, max_width, bottom - y)
 
     def _close_context_menu(self) -> None:
         """Closes the context menu."""
@@ -450,7 +581,10 @@ class Game:
         self.world_state.context_menu.active = False
         self.world_state.context_menu.pos = None
         self.world_state.context_menu.rects.clear()
+        self.world_state.context_menu.label_blits.clear()
         self.world_state.context_menu.target_tile = None
+        self.world_state.context_menu.hover_pos = None
+        self.world_state.context_menu.panel_rect = None
 
     def _handle_context_menu_click(self, mouse_pos: Tuple[int, int]) -> None:
         """Handles a click when the context menu is active."""
@@ -458,28 +592,28 @@ class Game:
 
         # Check for sub-menu click first, as it's on top
         if context_menu.sub_menu.active:
-            for i, rect in enumerate(context_menu.sub_menu.rects):
-                if rect.collidepoint(mouse_pos):
-                    option = context_menu.sub_menu.options[i]
-                    print(f"Sub-menu option clicked: {option}")
-                    self._issue_move_command_to_target()
-                    self._close_context_menu()  # Close everything after action
-                    return
+            i = _menu_item_at(context_menu.sub_menu.rects, mouse_pos)
+            if i != -1:
+                option = context_menu.sub_menu.options[i]
+                print(f"Sub-menu option clicked: {option}")
+                self._issue_move_command_to_target()
+                self._close_context_menu()  # Close everything after action
+                return
 
         # Check for main menu click
-        for i, rect in enumerate(context_menu.rects):
-            if rect.collidepoint(mouse_pos):
-                option_data = context_menu.options[i]
-                # If the clicked item has a sub-menu, do nothing.
-                # This allows the user to move their mouse to the sub-menu.
-                if "sub_options" in option_data:
-                    return
-
-                # If it's a normal command, execute it.
-                if option_data["label"] in ["Attack", "MoveTo"]:
-                    self._issue_move_command_to_target()
-                    self._close_context_menu()
-                    return
+        i = _menu_item_at(context_menu.rects, mouse_pos)
+        if i != -1:
+            option_data = context_menu.options[i]
+            # If the clicked item has a sub-menu, do nothing.
+            # This allows the user to move their mouse to the sub-menu.
+            if "sub_options" in option_data:
+                return
+
+            # If it's a normal command, execute it.
+            if option_data["label"] in ["Attack", "MoveTo"]:
+                self._issue_move_command_to_target()
+                self._close_context_menu()
+                return
 
         # If we clicked, but not on an actionable item (e.g., outside all menus),
         # then close the menu.
@@ -546,32 +680,49 @@ class Game:
         map_height_pixels = self.map.height * settings.TILE_SIZE
         self.camera.update(dt, events, map_width_pixels, map_height_pixels)
 
-        # Update all units
+        # Sample the mouse once per frame and share it with the hover logic and
+        # the debug panel instead of querying SDL from each of them.
+        self.mouse_pos = pygame.mouse.get_pos()
+
+        # Update all units that are on the move
         for unit in self.world_state.units:
-            unit.update(dt, self.map.width, self.map.height)
+            if unit.moving:
+                unit.update(dt, map_width_pixels, map_height_pixels)
 
         if self.world_state.context_menu.active:
-            self._handle_context_menu_hover(pygame.mouse.get_pos())
+            self._handle_context_menu_hover(self.mouse_pos)
         else:
-            self._update_hovered_tile()
+            self._update_hovered_tile(self.mouse_pos)
 
         if self.globe_state.is_showing:
             self._update_globe_animation(dt)
 
     def _update_globe_animation(self, dt: float) -> None:
         """Cycles through the globe animation frames based on a timer."""
-        if not self.globe_state.frames:
+        globe_state = self.globe_state
+        if not globe_state.frame_count:
             return
-        self.globe_state.animation_timer += dt
-        if self.globe_state.animation_timer >= settings.GLOBE_FRAME_DURATION:
-            self.globe_state.animation_timer = 0
-            self.globe_state.frame_index = ((self.globe_state.frame_index + 1)
-            % len(self.globe_state.frames))
-
-    def _update_hovered_tile(self) -> None:
+        globe_state.animation_timer += dt
+        frame_duration = settings.GLOBE_FRAME_DURATION
+        if globe_state.animation_timer >= frame_duration:
+            # Carry the remainder over to keep the frame rate steady, but drop
+            # the whole backlog after a long stall so only one frame advances.
+            remainder = globe_state.animation_timer - frame_duration
+            globe_state.animation_timer = remainder if remainder < frame_duration else 0.0
+            next_index = globe_state.frame_index + 1
+            globe_state.frame_index = 0 if next_index >= globe_state.frame_count else next_index
+
+    def _update_hovered_tile(self, mouse_pos: Tuple[int, int]) -> None:
         """Calculates which map tile is currently under the mouse cursor."""
-        mouse_pos = pygame.mouse.get_pos()
-        world_pos = self.camera.screen_to_world(mouse_pos)
+        # The hovered tile only changes when the mouse or the camera view changes;
+        # the viewport size matters too, as resizing moves the screen centre.
+        camera = self.camera
+        hover_key = (mouse_pos, camera.position.x, camera.position.y,
+                     camera.zoom_state.current, camera.width, camera.height)
+        if hover_key == self._hover_key:
+            return
+        self._hover_key = hover_key
+        world_pos = camera.screen_to_world(mouse_pos)
 
         map_width_pixels = self.map.width * self.map.tile_size
         map_height_pixels = self.map.height * self.map.tile_size
@@ -596,119 +747,144 @@ class Game:
         for unit in self.world_state.units:
             unit.draw(self.screen, self.camera, map_width_pixels, map_height_pixels)
 
+        self._draw_ui()
+        self.debug_panel.draw(self)
+        pygame.display.flip()
+
+    def _draw_ui(self) -> None:
+        """Draws the selection box, globe popup and context menus, if any are visible."""
+        world_state = self.world_state
+        context_menu = world_state.context_menu
+        # In the common case nothing is open, so skip the individual checks.
+        if not (world_state.selection_box or self.globe_state.is_showing or context_menu.active):
+            return
+
         # Draw selection box
-        if self.world_state.selection_box:
+        if world_state.selection_box:
             pygame.draw.rect(self.screen, settings.SELECTION_BOX_COLOR,
-                             self.world_state.selection_box, settings.SELECTION_BOX_BORDER_WIDTH)
+                             world_state.selection_box, settings.SELECTION_BOX_BORDER_WIDTH)
 
         # Draw globe popup if active
         if self.globe_state.is_showing:
             self._draw_globe_popup()
 
         # Draw context menu if active
-        if self.world_state.context_menu.active:
+        if context_menu.active:
             self._draw_context_menu()
-            if self.world_state.context_menu.sub_menu.active:
+            if context_menu.sub_menu.active:
                 self._draw_sub_menu()
 
-        self.debug_panel.draw(self)
-        pygame.display.flip()
-
     def _draw_globe_popup(self) -> None:
         """Draws the globe animation popup in the center of the screen."""
         if not self.globe_state.frames:
             # Optionally, draw a "no frames found" message
             return
 
-        # 1. Draw a semi-transparent overlay to dim the background
-        overlay = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180)) # Black with 180/255 alpha
-        self.screen.blit(overlay, (0, 0))
-
-        # 2. Get the current frame and its size
-        current_frame = self.globe_state.frames[self.globe_state.frame_index]
-        frame_rect = current_frame.get_rect()
-
-        # 3. Define the popup box size (with padding)
-        padding = 40
-        popup_width = frame_rect.width + padding
-        popup_height = frame_rect.height + padding
-        popup_rect = pygame.Rect(0, 0, popup_width, popup_height)
-        popup_rect.center = (settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2)
-
-        # 4. Draw the popup box and the globe frame inside it
-        pygame.draw.rect(self.screen, (40, 40, 60), popup_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (200, 200, 220), popup_rect, width=2, border_radius=10)
-        self.screen.blit(current_frame, (popup_rect.x + padding // 2, popup_rect.y + padding // 2))
+        globe_state = self.globe_state
+        screen_size = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+
+        # 1. Get the semi-transparent overlay that dims the background
+        overlay = globe_state.overlay_surface
+        if overlay is None or overlay.get_size() != screen_size:
+            overlay = pygame.Surface(screen_size, pygame.SRCALPHA).convert_alpha()
+            overlay.fill(settings.GLOBE_POPUP_OVERLAY_COLOR)
+            globe_state.overlay_surface = overlay
+
+        # 2. Get the current frame
+        current_frame = globe_state.frames[globe_state.frame_index]
+
+        # 3. Lay out the popup box (with padding) if the screen or frame size changed
+        layout_key = (screen_size, current_frame.get_size())
+        if layout_key != globe_state.layout_key:
+            self._layout_globe_popup(current_frame.get_size())
+            globe_state.layout_key = layout_key
+
+        # 4. Draw the overlay, the popup box and the globe frame inside it in one batch
+        self.screen.blits((
+            (overlay, (0, 0)),
+            (globe_state.panel_surface, globe_state.popup_rect),
+            (current_frame, globe_state.frame_pos),
+        ), False)
+
+    def _layout_globe_popup(self, frame_size: Tuple[int, int]) -> None:
+        """Centers the globe popup on screen and rebuilds its panel surface if needed."""
+        padding = settings.GLOBE_POPUP_PADDING
+        popup_rect = pygame.Rect(0, 0, frame_size[0] + padding, frame_size[1] + padding)
+        popup_rect.center = (self.camera.width // 2, self.camera.height // 2)
+        self.globe_state.popup_rect = popup_rect
+        self.globe_state.frame_pos = (popup_rect.x + padding // 2, popup_rect.y + padding // 2)
+
+        panel_surface = self.globe_state.panel_surface
+        if panel_surface is None or panel_surface.get_size() != popup_rect.size:
+            self.globe_state.panel_surface = self._build_globe_panel(popup_rect.size)
+
+    def _build_globe_panel(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Pre-draws the globe popup's background and border onto a surface of the given size."""
+        panel_surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        panel_rect = panel_surface.get_rect()
+        radius = settings.GLOBE_POPUP_BORDER_RADIUS
+        pygame.draw.rect(panel_surface, settings.GLOBE_POPUP_BG_COLOR, panel_rect,
+                         border_radius=radius)
+        pygame.draw.rect(panel_surface, settings.GLOBE_POPUP_BORDER_COLOR, panel_rect,
+                         width=2, border_radius=radius)
+        return panel_surface
 
     def _draw_context_menu(self) -> None:
         """Renders the context menu on the screen."""
-        if not self.world_state.context_menu.rects:
-            return
-
-        for i, rect in enumerate(self.world_state.context_menu.rects):
-            option_text = self.world_state.context_menu.options[i]["label"]
-
-            # Draw background and border
-            pygame.draw.rect(self.screen, settings.CONTEXT_MENU_BG_COLOR, rect)
-            pygame.draw.rect(self.screen, settings.CONTEXT_MENU_BORDER_COLOR, rect, 1)
-
-            text_surface = self.world_state.context_menu.font.render(
-                option_text, True, settings.CONTEXT_MENU_TEXT_COLOR)
-            text_x = rect.x + settings.CONTEXT_MENU_PADDING
-            text_y = rect.y + (settings.CONTEXT_MENU_PADDING / 2)
-            self.screen.blit(text_surface, (text_x, text_y))
+        self._draw_menu_items(self.world_state.context_menu)
 
     def _draw_sub_menu(self) -> None:
         """Renders the sub-menu on the screen."""
-        context_menu = self.world_state.context_menu
-        if not context_menu.sub_menu.rects:
-            return
-
-        for i, rect in enumerate(context_menu.sub_menu.rects):
-            option_text = context_menu.sub_menu.options[i]
-
+        self._draw_menu_items(self.world_state.context_menu.sub_menu)
+
+    def _draw_menu_items(self, menu: Union[ContextMenuState, SubMenuState]) -> None:
+        """Draws the background and border of each menu item, then all labels in one batch."""
+        # Bind loop invariants to locals to avoid repeated attribute lookups.
+        screen = self.screen
+        draw_rect = pygame.draw.rect
+        bg_color = settings.CONTEXT_MENU_BG_COLOR
+        border_color = settings.CONTEXT_MENU_BORDER_COLOR
+        for rect in menu.rects:
             # Draw background and border
-            pygame.draw.rect(self.screen, settings.CONTEXT_MENU_BG_COLOR, rect)
-            pygame.draw.rect(self.screen, settings.CONTEXT_MENU_BORDER_COLOR, rect, 1)
-
-            text_surface = context_menu.font.render(
-                option_text, True, settings.CONTEXT_MENU_TEXT_COLOR
-            )
-            text_x = rect.x + settings.CONTEXT_MENU_PADDING
-            text_y = rect.y + (settings.CONTEXT_MENU_PADDING / 2)
-            self.screen.blit(text_surface, (text_x, text_y))
+            draw_rect(screen, bg_color, rect)
+            draw_rect(screen, border_color, rect, 1)
+        # Items don't overlap, so the labels can go in a single batched blit.
+        screen.blits(menu.label_blits, False)
 
     def _handle_context_menu_hover(self, mouse_pos: Tuple[int, int]) -> None:
         """Handles hover events for the context menu to show sub-menus."""
         context_menu = self.world_state.context_menu
+        # Hover state only changes when the mouse moves, so skip repeat positions.
+        if mouse_pos == context_menu.hover_pos:
+            return
+        context_menu.hover_pos = mouse_pos
 
-        hovered_main_item = False
-        for i, rect in enumerate(context_menu.rects):
-            if rect.collidepoint(mouse_pos):
-                hovered_main_item = True
-                option_data = context_menu.options[i]
-                if "sub_options" in option_data:
-                    # Open sub-menu if not already open for this item
-                    if (not context_menu.sub_menu.active
-                            or context_menu.sub_menu.parent_rect != rect):
-                        self._open_sub_menu(option_data["sub_options"], rect)
-                else:
-                    # This item has no sub-menu, so close any active one
-                    self._close_sub_menu()
-                break  # Found the hovered item
-
-        if not hovered_main_item:
-            # Mouse is not over any main menu item. Check if it's over the sub-menu.
-            is_mouse_on_sub_menu = False
-            if context_menu.sub_menu.active:
-                for sub_rect in context_menu.sub_menu.rects:
-                    if sub_rect.collidepoint(mouse_pos):
-                        is_mouse_on_sub_menu = True
-                        break
+        # Cheap reject: the mouse is outside both menu panels entirely.
+        sub_menu = context_menu.sub_menu
+        if not (context_menu.panel_rect.collidepoint(mouse_pos)
+                or (sub_menu.active and sub_menu.panel_rect.collidepoint(mouse_pos))):
+            self._close_sub_menu()
+            return
 
-            if not is_mouse_on_sub_menu:
+        i = _menu_item_at(context_menu.rects, mouse_pos)
+        if i != -1:
+            rect = context_menu.rects[i]
+            option_data = context_menu.options[i]
+            if "sub_options" in option_data:
+                # Open sub-menu if not already open for this item
+                if (not context_menu.sub_menu.active
+                        or context_menu.sub_menu.parent_rect != rect):
+                    self._open_sub_menu(option_data["sub_options"], rect)
+            else:
+                # This item has no sub-menu, so close any active one
                 self._close_sub_menu()
+            return
+
+        # Mouse is not over any main menu item. Check if it's over the sub-menu.
+        is_mouse_on_sub_menu = (context_menu.sub_menu.active
+                                and _menu_item_at(context_menu.sub_menu.rects, mouse_pos) != -1)
+        if not is_mouse_on_sub_menu:
+            self._close_sub_menu()
 
     def _open_sub_menu(self, sub_options: List[str], parent_rect: pygame.Rect) -> None:
         """Opens a sub-menu next to a parent menu item."""
@@ -716,19 +892,9 @@ class Game:
         context_menu.sub_menu.active = True
         context_menu.sub_menu.options = sub_options.copy()
         context_menu.sub_menu.parent_rect = parent_rect
-        context_menu.sub_menu.rects.clear()
 
         # Position sub-menu to the right of the parent
-        x = parent_rect.right
-        y = parent_rect.top
-        padding = settings.CONTEXT_MENU_PADDING
-
-        for i, option_text in enumerate(sub_options):
-            text_surface = context_menu.font.render(option_text, True, (0, 0, 0))
-            width = text_surface.get_width() + padding * 2
-            height = text_surface.get_height() + padding
-            rect = pygame.Rect(x, y + i * height, width, height)
-            context_menu.sub_menu.rects.append(rect)
+        self._set_menu_layout(context_menu.sub_menu, sub_options, parent_rect.topright)
 
     def _close_sub_menu(self) -> None:
         """Closes the sub-menu."""
@@ -738,4 +904,6 @@ class Game:
         context_menu.sub_menu.active = False
         context_menu.sub_menu.options.clear()
         context_menu.sub_menu.rects.clear()
+        context_menu.sub_menu.label_blits.clear()
+        context_menu.sub_menu.panel_rect = None
         context_menu.sub_menu.parent_rect = None
@@ -1,19 +1,22 @@
 # c:/prj/WorldDom/src/globe_renderer.py
 """
 Handles the generation of globe animation frames based on map data.
+
+numpy, matplotlib and cartopy are slow to import and only needed when frames
+actually have to be rendered, so they are imported inside the functions that
+use them. Starting a game whose frames are already cached never loads them.
 """
+from __future__ import annotations
 import os
 from dataclasses import dataclass
-from typing import Generator, List
-
-import cartopy.crs as ccrs
-import matplotlib.pyplot as plt
-import numpy as np
-from matplotlib.colors import ListedColormap
-from numpy.typing import NDArray
+from typing import TYPE_CHECKING, Generator, List
 
 import settings
 
+if TYPE_CHECKING:
+    from matplotlib.colors import ListedColormap
+    from numpy.typing import NDArray
+
 
 @dataclass
 class GlobeRenderData:
@@ -26,6 +29,10 @@ class GlobeRenderData:
 
 def _prepare_globe_data(map_data: List[List[str]]) -> GlobeRenderData:
     """Converts map data to numerical grid, creates lat/lon coordinates and colormap."""
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    from matplotlib.colors import ListedColormap
+
     terrain_map = {'water': 0, 'sand': 1, 'grass': 2, 'rock': 3}
     numerical_data = np.array(
         [[terrain_map.get(cell, 0) for cell in row] for row in map_data]
@@ -48,6 +55,10 @@ def _render_globe_frame(
     render_data: GlobeRenderData
 ) -> None:
     """Renders and saves a single frame of the globe animation."""
+    # pylint: disable=import-outside-toplevel
+    import cartopy.crs as ccrs
+    import matplotlib.pyplot as plt
+
     longitude = -180 + (360 * frame_index / settings.GLOBE_NUM_FRAMES)
     projection = ccrs.Orthographic(central_longitude=longitude, central_latitude=20)
     dpi = settings.GLOBE_IMAGE_SIZE_PIXELS / 5
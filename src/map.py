@@ -7,6 +7,7 @@ import heapq
 import math
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pygame
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
 @dataclass
 class VisibleArea:
     """Represents the visible area of the map in tile coordinates."""
+    __slots__ = ("start_row", "end_row", "start_col", "end_col")
     start_row: int
     end_row: int
     start_col: int
@@ -55,6 +57,22 @@ COASTAL_THRESHOLD = 0.1  # Land below this elevation cannot be a lake.
 ROCK_THRESHOLD = 0.2   # Of land tiles, noise values above this become rock.
 LAKE_THRESHOLD = -0.3  # Of remaining land tiles, noise values below this become lake
 
+@lru_cache(maxsize=None)
+def _octave_weights(
+    octaves: int, persistence: float, lacunarity: float
+) -> Tuple[Tuple[Tuple[float, float], ...], float]:
+    """Returns the (frequency, amplitude) of each octave and the sum of the amplitudes."""
+    weights = []
+    frequency = 1.0
+    amplitude = 1.0
+    max_value = 0.0  # Used for normalizing to [-1, 1]
+    for _ in range(octaves):
+        weights.append((frequency, amplitude))
+        max_value += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+    return tuple(weights), max_value
+
 class Map:
     """
     Manages the game's tile-based map.
@@ -85,17 +103,12 @@ class Map:
         lacunarity: float
     ) -> float:
         """Generates fractal noise using an OpenSimplex generator."""
+        weights, max_value = _octave_weights(octaves, persistence, lacunarity)
+        noise4 = gen.noise4
         total = 0.0
-        frequency = 1.0
-        amplitude = 1.0
-        max_value = 0.0  # Used for normalizing to [-1, 1]
-        for _ in range(octaves):
-            noise_val = gen.noise4(x * frequency, y * frequency,
-                                   z * frequency, w * frequency)
-            total += noise_val * amplitude
-            max_value += amplitude
-            amplitude *= persistence
-            frequency *= lacunarity
+        for frequency, amplitude in weights:
+            total += noise4(x * frequency, y * frequency,
+                            z * frequency, w * frequency) * amplitude
         return total / max_value if max_value > 0 else 0
 
     def _generate_map(self) -> List[List[str]]:
@@ -109,18 +122,23 @@ class Map:
 
         world = [["" for _ in range(self.width)] for _ in range(self.height)]
 
+        # Each column and row maps to a fixed point on a circle, so the trig is
+        # computed once per column/row instead of for every tile and noise layer.
+        col_points = self._circle_points(self.width)
+        row_points = self._circle_points(self.height)
+
         for y in range(self.height):
+            row_point = row_points[y]
             for x in range(self.width):
-                angle_x = (x / self.width) * 2 * math.pi
-                angle_y = (y / self.height) * 2 * math.pi
+                col_point = col_points[x]
 
-                elevation = self._get_elevation_noise(e_gen, angle_x, angle_y)
+                elevation = self._get_elevation_noise(e_gen, col_point, row_point)
 
                 if elevation < OCEAN_THRESHOLD:
                     world[y][x] = "ocean"
                     continue
 
-                mountain_value = self._get_mountain_noise(m_gen, angle_x, angle_y)
+                mountain_value = self._get_mountain_noise(m_gen, col_point, row_point)
                 if mountain_value > ROCK_THRESHOLD:
                     world[y][x] = "rock"
                     continue
@@ -129,7 +147,7 @@ class Map:
                     world[y][x] = "grass"
                     continue
 
-                lake_value = self._get_lake_noise(l_gen, angle_x, angle_y)
+                lake_value = self._get_lake_noise(l_gen, col_point, row_point)
                 if lake_value < LAKE_THRESHOLD:
                     world[y][x] = "lake"
                 else:
@@ -139,23 +157,38 @@ class Map:
         self._fill_large_lakes(world)
         return world
 
-    def _get_elevation_noise(self, gen: OpenSimplex, angle_x: float, angle_y: float) -> float:
-        """Generates elevation noise for a given angle."""
-        ex = math.cos(angle_x) * ELEVATION_SCALE
-        ey = math.sin(angle_x) * ELEVATION_SCALE
-        ez = math.cos(angle_y) * ELEVATION_SCALE
-        ew = math.sin(angle_y) * ELEVATION_SCALE
+    @staticmethod
+    def _circle_points(count: int) -> List[Tuple[float, float]]:
+        """Returns the (cos, sin) of each of count evenly spaced angles around a circle."""
+        points = []
+        for i in range(count):
+            angle = (i / count) * 2 * math.pi
+            points.append((math.cos(angle), math.sin(angle)))
+        return points
+
+    def _get_elevation_noise(
+        self, gen: OpenSimplex,
+        col_point: Tuple[float, float], row_point: Tuple[float, float]
+    ) -> float:
+        """Generates elevation noise for a given column and row circle point."""
+        ex = col_point[0] * ELEVATION_SCALE
+        ey = col_point[1] * ELEVATION_SCALE
+        ez = row_point[0] * ELEVATION_SCALE
+        ew = row_point[1] * ELEVATION_SCALE
         return self._fractal_noise(
             gen, ex, ey, ez, ew,
             octaves=ELEVATION_OCTAVES,
             persistence=ELEVATION_PERSISTENCE,
             lacunarity=ELEVATION_LACUNARITY)
 
-    def _get_mountain_noise(self, gen: OpenSimplex, angle_x: float, angle_y: float) -> float:
-        """Generates mountain noise for a given angle."""
-        mx, my = (math.cos(angle_x) * MOUNTAIN_SCALE,
-                  math.sin(angle_x) * MOUNTAIN_SCALE)
-        mz, mw = math.cos(angle_y) * MOUNTAIN_SCALE, math.sin(angle_y) * MOUNTAIN_SCALE
+    def _get_mountain_noise(
+        self, gen: OpenSimplex,
+        col_point: Tuple[float, float], row_point: Tuple[float, float]
+    ) -> float:
+        """Generates mountain noise for a given column and row circle point."""
+        mx, my = (col_point[0] * MOUNTAIN_SCALE,
+                  col_point[1] * MOUNTAIN_SCALE)
+        mz, mw = row_point[0] * MOUNTAIN_SCALE, row_point[1] * MOUNTAIN_SCALE
         return self._fractal_noise(
             gen, mx, my, mz, mw,
             octaves=MOUNTAIN_OCTAVES,
@@ -163,10 +196,13 @@ class Map:
             lacunarity=MOUNTAIN_LACUNARITY
         )
 
-    def _get_lake_noise(self, gen: OpenSimplex, angle_x: float, angle_y: float) -> float:
-        """Generates lake noise for a given angle."""
-        lx, ly = math.cos(angle_x) * LAKE_SCALE, math.sin(angle_x) * LAKE_SCALE
-        lz, lw = math.cos(angle_y) * LAKE_SCALE, math.sin(angle_y) * LAKE_SCALE
+    def _get_lake_noise(
+        self, gen: OpenSimplex,
+        col_point: Tuple[float, float], row_point: Tuple[float, float]
+    ) -> float:
+        """Generates lake noise for a given column and row circle point."""
+        lx, ly = col_point[0] * LAKE_SCALE, col_point[1] * LAKE_SCALE
+        lz, lw = row_point[0] * LAKE_SCALE, row_point[1] * LAKE_SCALE
         return self._fractal_noise(
             gen, lx, ly, lz, lw,
             octaves=LAKE_OCTAVES,
@@ -250,108 +286,90 @@ class Map:
         camera: Camera,
         hovered_tile: Optional[Tuple[int, int]] = None
     ) -> None:
-        """Renders the map, handling toroidal wrapping by drawing multiple copies."""
-        map_width_pixels = self.width * self.tile_size
-        map_height_pixels = self.height * self.tile_size
-
-        # Draw the map multiple times to create a seamless wrap-around effect
-        for dx in [-map_width_pixels, 0, map_width_pixels]:
-            for dy in [-map_height_pixels, 0, map_height_pixels]:
-                offset = pygame.math.Vector2(dx, dy)
-                self._draw_single_map_instance(surface, camera, hovered_tile, offset)
-
-    def _draw_single_map_instance(
-        self,
-        surface: pygame.Surface,
-        camera: Camera,
-        hovered_tile: Optional[Tuple[int, int]],
-        offset: pygame.math.Vector2  # pylint: disable=c-extension-no-member
-    ) -> None:
-        """Draws a single instance of the map with a given offset."""
-        visible_area = self._calculate_visible_area(camera, offset)
-
-        self._draw_terrain(
-            surface, camera,
-            area=visible_area, offset=offset, hovered_tile=hovered_tile
-        )
-        self._draw_grid_lines(surface, camera, visible_area, offset)
-
-    def _calculate_visible_area(
-        self, camera: Camera, offset: pygame.math.Vector2  # pylint: disable=c-extension-no-member
-    ) -> VisibleArea:
-        """Calculates the visible tile range based on the camera's view and an offset."""
-        top_left_world = camera.screen_to_world((0, 0)) - offset
-        bottom_right_screen_pos = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
-        bottom_right_world = (
-            camera.screen_to_world(bottom_right_screen_pos) - offset
-        )
-
-        start_col = math.floor(top_left_world.x / self.tile_size)
-        end_col = math.ceil(bottom_right_world.x / self.tile_size)
-        start_row = math.floor(top_left_world.y / self.tile_size)
-        end_row = math.ceil(bottom_right_world.y / self.tile_size)
+        """Renders the visible part of the map, wrapping seamlessly at the edges."""
+        # Tile indices are taken modulo the map size, so a single pass over the
+        # visible tile range already covers every wrapped copy on screen.
+        visible_area = self._calculate_visible_area(camera)
+
+        self._draw_terrain(surface, camera, visible_area, hovered_tile)
+        self._draw_grid_lines(surface, camera, visible_area)
+
+    def _calculate_visible_area(self, camera: Camera) -> VisibleArea:
+        """Calculates the visible tile range based on the camera's view."""
+        left, top, right, bottom = camera.get_visible_world_bounds()
+
+        start_col = math.floor(left / self.tile_size)
+        end_col = math.ceil(right / self.tile_size)
+        start_row = math.floor(top / self.tile_size)
+        end_row = math.ceil(bottom / self.tile_size)
         return VisibleArea(start_row, end_row, start_col, end_col)
 
-    def _draw_terrain(  # pylint: disable=too-many-arguments
-        self, surface: pygame.Surface, camera: Camera, *,
-        area: VisibleArea,
-        offset: pygame.math.Vector2,  # pylint: disable=c-extension-no-member
-        hovered_tile: Optional[Tuple[int, int]]
+    def _draw_terrain(  # pylint: disable=too-many-locals
+        self, surface: pygame.Surface, camera: Camera,
+        area: VisibleArea, hovered_tile: Optional[Tuple[int, int]]
     ) -> None:
         """Draws the terrain tiles and the hover highlight."""
+        # Screen x only depends on the column and screen y on the row, so both are
+        # computed once up front (matching Camera.apply's rounding) instead of
+        # building and transforming a Rect for every tile.
+        zoom = camera.zoom_state.current
+        tile_size = self.tile_size
+        screen_size = round(tile_size * zoom)
+        screen_xs = [
+            round((x * tile_size - camera.position.x) * zoom + camera.screen_center.x)
+            for x in range(area.start_col, area.end_col)
+        ]
+        # Bind the colour table once rather than looking it up on settings per tile.
+        terrain_colors = settings.TERRAIN_COLORS
+        draw_rect = pygame.draw.rect
         for y in range(area.start_row, area.end_row):
-            for x in range(area.start_col, area.end_col):
-                map_x, map_y = x % self.width, y % self.height
-                terrain = self.data[map_y][map_x]
-                world_x = x * self.tile_size + offset.x
-                world_y = y * self.tile_size + offset.y
-                world_rect = pygame.Rect(
-                    world_x, world_y, self.tile_size, self.tile_size
-                )
-                screen_rect = camera.apply(world_rect)
+            map_y = y % self.height
+            row = self.data[map_y]
+            screen_y = round((y * tile_size - camera.position.y) * zoom + camera.screen_center.y)
+            for x, screen_x in enumerate(screen_xs, area.start_col):
+                map_x = x % self.width
+                screen_rect = (screen_x, screen_y, screen_size, screen_size)
 
                 # Draw the terrain tile
-                pygame.draw.rect(surface, settings.TERRAIN_COLORS[terrain], screen_rect)
+                draw_rect(surface, terrain_colors[row[map_x]], screen_rect)
 
                 # Draw the highlight on top if this is the hovered tile
                 if (map_x, map_y) == hovered_tile:
-                    pygame.draw.rect(surface, settings.HIGHLIGHT_COLOR, screen_rect, 3)
+                    draw_rect(surface, settings.HIGHLIGHT_COLOR, screen_rect, 3)
 
     def _draw_vertical_grid_lines(
-        self, surface: pygame.Surface, camera: Camera,
-        area: VisibleArea, offset: pygame.math.Vector2 # pylint: disable=c-extension-no-member
+        self, surface: pygame.Surface, camera: Camera, area: VisibleArea
     ) -> None:
-        """Draws the vertical grid lines with a given offset."""
+        """Draws the vertical grid lines."""
+        line_color = settings.GRID_LINE_COLOR
+        screen_height = settings.SCREEN_HEIGHT
         for col in range(area.start_col, area.end_col):
-            world_x = col * self.tile_size + offset.x
+            world_x = col * self.tile_size
             screen_x = round(
                 camera.world_to_screen(pygame.math.Vector2(world_x, 0)).x # pylint: disable=c-extension-no-member
             )
-            start_pos = (screen_x, 0)
-            end_pos = (screen_x, settings.SCREEN_HEIGHT)
-            pygame.draw.line(surface, settings.GRID_LINE_COLOR, start_pos, end_pos, 1)
+            pygame.draw.line(surface, line_color, (screen_x, 0), (screen_x, screen_height), 1)
 
     def _draw_horizontal_grid_lines(
-        self, surface: pygame.Surface, camera: Camera,
-        area: VisibleArea, offset: pygame.math.Vector2 # pylint: disable=c-extension-no-member
+        self, surface: pygame.Surface, camera: Camera, area: VisibleArea
     ) -> None:
-        """Draws the horizontal grid lines with a given offset."""
+        """Draws the horizontal grid lines."""
+        line_color = settings.GRID_LINE_COLOR
+        screen_width = settings.SCREEN_WIDTH
         for row in range(area.start_row, area.end_row):
-            world_y = row * self.tile_size + offset.y
+            world_y = row * self.tile_size
             screen_y = round(
                 camera.world_to_screen(pygame.math.Vector2(0, world_y)).y # pylint: disable=c-extension-no-member
             )
-            start_pos = (0, screen_y)
-            end_pos = (settings.SCREEN_WIDTH, screen_y)
-            pygame.draw.line(surface, settings.GRID_LINE_COLOR, start_pos, end_pos, 1)
+            pygame.draw.line(surface, line_color, (0, screen_y), (screen_width, screen_y), 1)
 
     def _draw_grid_lines(self, surface: pygame.Surface, camera: Camera,
-                         area: VisibleArea, offset: pygame.math.Vector2) -> None: # pylint: disable=c-extension-no-member
+                         area: VisibleArea) -> None:
         """Draws the grid lines over the terrain."""
         scaled_tile_size = settings.TILE_SIZE * camera.zoom_state.current
         if scaled_tile_size >= settings.MIN_TILE_PIXELS_FOR_GRID:
-            self._draw_vertical_grid_lines(surface, camera, area, offset)
-            self._draw_horizontal_grid_lines(surface, camera, area, offset)
+            self._draw_vertical_grid_lines(surface, camera, area)
+            self._draw_horizontal_grid_lines(surface, camera, area)
 
     def is_walkable(self, tile_pos: Tuple[int, int]) -> bool:
         """Checks if a given tile is walkable based on its terrain type."""
@@ -45,6 +45,7 @@ UNIT_COLOR = (255, 0, 0)  # Red
 UNIT_SELECTED_COLOR = (255, 255, 255) # White
 UNIT_RADIUS = TILE_SIZE // 3
 UNIT_MOVES_PER_SECOND = 3.0 # How many tiles the unit moves in one second.
+UNIT_SPEED = UNIT_MOVES_PER_SECOND * TILE_SIZE # Movement speed in pixels per second.
 UNIT_INNER_CIRCLE_RATIO = 0.8 # For drawing the selected unit
 
 # --- UI Settings ---
@@ -63,3 +64,10 @@ CONTEXT_MENU_BORDER_COLOR = (150, 150, 150)
 CONTEXT_MENU_TEXT_COLOR = (240, 240, 240)
 CONTEXT_MENU_FONT_SIZE = 16
 CONTEXT_MENU_PADDING = 8
+
+# Globe Popup
+GLOBE_POPUP_OVERLAY_COLOR = (0, 0, 0, 180)  # Black with 180/255 alpha
+GLOBE_POPUP_BG_COLOR = (40, 40, 60)
+GLOBE_POPUP_BORDER_COLOR = (200, 200, 220)
+GLOBE_POPUP_BORDER_RADIUS = 10
+GLOBE_POPUP_PADDING = 40
@@ -3,17 +3,50 @@ This module defines the Unit class, which represents a single unit in the game.
 """
 from __future__ import annotations
 import math
-from typing import TYPE_CHECKING, List, Tuple
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Deque, List, Tuple
 
 import pygame
 
-from settings import (TILE_SIZE, UNIT_RADIUS, UNIT_MOVES_PER_SECOND,
+from settings import (TILE_SIZE, UNIT_RADIUS, UNIT_SPEED,
                       UNIT_COLOR, UNIT_SELECTED_COLOR,
                       UNIT_INNER_CIRCLE_RATIO)
 
 if TYPE_CHECKING:
     from camera import Camera
 
+# Unit sprites keyed by (selected, radius), shared by all units and kept in LRU order.
+_GLYPH_CACHE: OrderedDict[Tuple[bool, int], pygame.Surface] = OrderedDict()
+_GLYPH_CACHE_SIZE = 32
+
+_TILE_HALF = TILE_SIZE / 2
+
+def _visible_wrap_offsets(coord: float, span: int, low: float, high: float) -> List[int]:
+    """Returns the wrap offsets along one axis at which a unit overlaps [low, high]."""
+    return [offset for offset in (-span, 0, span)
+            if coord + offset + UNIT_RADIUS > low and coord + offset - UNIT_RADIUS < high]
+
+def _get_unit_glyph(selected: bool, radius: int) -> pygame.Surface:
+    """Returns a cached, pre-rendered unit sprite for the given state and screen radius."""
+    key = (selected, radius)
+    glyph = _GLYPH_CACHE.get(key)
+    if glyph is not None:
+        _GLYPH_CACHE.move_to_end(key)
+    else:
+        glyph = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        center = (radius, radius)
+        # Draw selection circle first (underneath the unit)
+        if selected:
+            pygame.draw.circle(glyph, UNIT_SELECTED_COLOR, center, radius)
+            pygame.draw.circle(glyph, UNIT_COLOR, center, int(radius * UNIT_INNER_CIRCLE_RATIO))
+        else:
+            pygame.draw.circle(glyph, UNIT_COLOR, center, radius)
+        glyph = glyph.convert_alpha()
+        _GLYPH_CACHE[key] = glyph
+        if len(_GLYPH_CACHE) > _GLYPH_CACHE_SIZE:
+            _GLYPH_CACHE.popitem(last=False)
+    return glyph
+
 class Unit:
     """Represents a single unit in the game."""
     def __init__(self, tile_pos: Tuple[int, int]) -> None:
@@ -28,87 +61,95 @@ class Unit:
         self.world_pos = (self.tile_pos * TILE_SIZE) + pygame.math.Vector2(TILE_SIZE / 2)
         self.target_world_pos = self.world_pos.copy()
         self.selected: bool = False
-        self.path: List[Tuple[int, int]] = []
+        self.path: Deque[Tuple[int, int]] = deque()
+        # True while the unit has somewhere to go; idle units are skipped by the game loop.
+        self.moving: bool = False
+        self._world_rect = pygame.Rect(0, 0, UNIT_RADIUS * 2, UNIT_RADIUS * 2)
 
     def get_world_rect(self) -> pygame.Rect:
-        """Gets the unit's bounding box in world coordinates for selection."""
-        size = UNIT_RADIUS * 2
-        top_left_x = self.world_pos.x - UNIT_RADIUS
-        top_left_y = self.world_pos.y - UNIT_RADIUS
-        return pygame.Rect(top_left_x, top_left_y, size, size)
+        """Gets the unit's bounding box in world coordinates for selection.
+
+        The same Rect is updated and returned on every call, so callers should
+        copy it if they need to keep it.
+        """
+        world_rect = self._world_rect
+        world_rect.x = int(self.world_pos.x - UNIT_RADIUS)
+        world_rect.y = int(self.world_pos.y - UNIT_RADIUS)
+        return world_rect
 
     def set_path(self, path: List[Tuple[int, int]]) -> None:
         """Sets a new path for the unit to follow."""
-        self.path = path
+        self.path = deque(path)
+        self.moving = True
 
-    def update(self, dt: float, map_width_tiles: int, map_height_tiles: int) -> None:
+    def update(self, dt: float, map_width_pixels: int, map_height_pixels: int) -> None:
         """Moves the unit smoothly along its path, handling toroidal map wrapping."""
-        map_width_pixels = map_width_tiles * TILE_SIZE
-        map_height_pixels = map_height_tiles * TILE_SIZE
+        world_pos = self.world_pos
+        target = self.target_world_pos
 
         # If we are at our destination, get the next destination from the path.
-        if self.world_pos == self.target_world_pos and self.path:
-            next_tile_pos = self.path.pop(0)
-            self.tile_pos = pygame.math.Vector2(next_tile_pos)
-            self.target_world_pos = (self.tile_pos * TILE_SIZE) + pygame.math.Vector2(TILE_SIZE / 2)
+        # Positions are updated in place to avoid allocating new vectors each frame.
+        if world_pos == target and self.path:
+            self._advance_to_next_tile()
 
-        # If we don't have a path or are already at the target, do nothing.
-        if self.world_pos == self.target_world_pos:
+        # If we don't have a path or are already at the target, we are idle.
+        if world_pos == target:
+            self.moving = bool(self.path)
             return
 
         # Calculate the shortest vector to the target on a toroidal map
-        move_vec = self.target_world_pos - self.world_pos
-        if abs(move_vec.x) > map_width_pixels / 2:
-            move_vec.x -= math.copysign(map_width_pixels, move_vec.x)
-        if abs(move_vec.y) > map_height_pixels / 2:
-            move_vec.y -= math.copysign(map_height_pixels, move_vec.y)
+        dx = target.x - world_pos.x
+        dy = target.y - world_pos.y
+        # (dx > half) - (dx < -half) is 1, 0 or -1, so each axis shifts by at most one map
+        # length without branching or calling copysign.
+        dx -= map_width_pixels * ((dx > map_width_pixels / 2) - (dx < -map_width_pixels / 2))
+        dy -= map_height_pixels * ((dy > map_height_pixels / 2) - (dy < -map_height_pixels / 2))
 
-        dist_to_target = move_vec.length()
+        dist_to_target = math.hypot(dx, dy)
 
         if dist_to_target > 0:
-            speed = UNIT_MOVES_PER_SECOND * TILE_SIZE
-            distance_to_move = speed * dt
+            distance_to_move = UNIT_SPEED * dt
 
             if distance_to_move >= dist_to_target:
                 # Snap to target
-                self.world_pos = self.target_world_pos.copy()
+                new_x, new_y = target.x, target.y
             else:
                 # Move towards the target
-                move_vec.normalize_ip()
-                self.world_pos += move_vec * distance_to_move
-
-            # Wrap the unit's world position for continuous movement
-            self.world_pos.x %= map_width_pixels
-            self.world_pos.y %= map_height_pixels
+                scale = distance_to_move / dist_to_target
+                new_x = world_pos.x + dx * scale
+                new_y = world_pos.y + dy * scale
+
+            # Wrap the unit's world position for continuous movement; most
+            # steps stay on the map, so only take the modulo when needed.
+            if not 0 <= new_x < map_width_pixels:
+                new_x %= map_width_pixels
+            if not 0 <= new_y < map_height_pixels:
+                new_y %= map_height_pixels
+            world_pos.update(new_x, new_y)
+
+    def _advance_to_next_tile(self) -> None:
+        """Pops the next tile off the path and makes its centre the movement target."""
+        col, row = self.path.popleft()
+        self.tile_pos.update(col, row)
+        self.target_world_pos.update(col * TILE_SIZE + _TILE_HALF, row * TILE_SIZE + _TILE_HALF)
 
     def draw(
         self, surface: pygame.Surface, camera: Camera,
         map_width_pixels: int, map_height_pixels: int
     ) -> None:
         """Draws the unit on the screen, handling toroidal map wrapping."""
-        for dx in [-map_width_pixels, 0, map_width_pixels]:
-            for dy in [-map_height_pixels, 0, map_height_pixels]:
-                offset = pygame.math.Vector2(dx, dy)
-                self._draw_single_unit_instance(surface, camera, self.world_pos + offset)
-
-    def _draw_single_unit_instance(
-        self, surface: pygame.Surface, camera: Camera,
-        pos: pygame.math.Vector2
-    ) -> None:
-        """Draws a single instance of the unit at a given position."""
-        screen_pos = camera.world_to_screen(pos)
         radius = int(UNIT_RADIUS * camera.zoom_state.current)
-
-        # Don't draw if the unit is completely off-screen
-        if screen_pos.x + radius < 0 or screen_pos.x - radius > camera.width:
-            return
-        if screen_pos.y + radius < 0 or screen_pos.y - radius > camera.height:
-            return
-
-        # Draw selection circle first (underneath the unit)
-        if self.selected:
-            pygame.draw.circle(surface, UNIT_SELECTED_COLOR, screen_pos, radius)
-            inner_radius = int(radius * UNIT_INNER_CIRCLE_RATIO)
-            pygame.draw.circle(surface, UNIT_COLOR, screen_pos, inner_radius)
-        else:
-            pygame.draw.circle(surface, UNIT_COLOR, screen_pos, radius)
+        glyph = _get_unit_glyph(self.selected, radius)
+
+        # Only the wrapped copies that overlap the camera's view need drawing;
+        # away from the map seams that is just the unit itself.
+        left, top, right, bottom = camera.get_visible_world_bounds()
+        x_offsets = _visible_wrap_offsets(self.world_pos.x, map_width_pixels, left, right)
+        y_offsets = _visible_wrap_offsets(self.world_pos.y, map_height_pixels, top, bottom)
+        # draw.circle truncates its centre to whole pixels, so do the same before
+        # offsetting by the radius to keep the sprite exactly where the circle was.
+        centers = [camera.world_to_screen(self.world_pos + (dx, dy))
+                   for dx in x_offsets for dy in y_offsets]
+        surface.blits([
+            (glyph, (int(center.x) - radius, int(center.y) - radius)) for center in centers
+        ], False)
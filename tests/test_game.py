@@ -0,0 +1,74 @@
+"""
+Unit tests for the Game class.
+"""
+import os
+import sys
+import unittest
+
+import pygame
+
+# This adds the 'src' directory to Python's path to allow for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# pylint: disable=wrong-import-position,protected-access
+from camera import Camera
+from game import Game, GlobeState, WorldState
+from map import Map
+from settings import GLOBE_FRAME_DURATION
+
+class TestGame(unittest.TestCase):
+    """Test suite for the Game class."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def _make_game(self):
+        """Builds a Game with just the state needed for hover tracking."""
+        game = Game.__new__(Game)
+        game.camera = Camera(800, 600)
+        game.map = Map(20, 20, seed=1)
+        game.world_state = WorldState()
+        game._hover_key = None
+        return game
+
+    def _expected_tile(self, game, mouse_pos):
+        """Computes the tile under mouse_pos directly from the camera."""
+        world_pos = game.camera.screen_to_world(mouse_pos)
+        map_width_pixels = game.map.width * game.map.tile_size
+        map_height_pixels = game.map.height * game.map.tile_size
+        return (int(world_pos.x % map_width_pixels // game.map.tile_size),
+                int(world_pos.y % map_height_pixels // game.map.tile_size))
+
+    def test_hovered_tile_follows_window_resize(self):
+        """Tests that resizing the window updates the hovered tile without mouse movement."""
+        game = self._make_game()
+        mouse_pos = (200, 200)
+        game._update_hovered_tile(mouse_pos)
+        self.assertEqual(game.world_state.hovered_tile, self._expected_tile(game, mouse_pos))
+
+        # Resize the viewport the same way the VIDEORESIZE handler does.
+        game.camera.width, game.camera.height = 400, 300
+        game.camera.screen_center = pygame.math.Vector2(200, 150)
+        game._update_hovered_tile(mouse_pos)
+        self.assertEqual(game.world_state.hovered_tile, self._expected_tile(game, mouse_pos))
+
+    def test_globe_animation_timer(self):
+        """Tests frame stepping, stall recovery and wrap-around of the globe animation."""
+        game = Game.__new__(Game)
+        game.globe_state = GlobeState()
+        game.globe_state.frame_count = 3
+
+        # A normal step advances one frame and carries the remainder over.
+        game._update_globe_animation(GLOBE_FRAME_DURATION * 1.5)
+        self.assertEqual(game.globe_state.frame_index, 1)
+        self.assertAlmostEqual(game.globe_state.animation_timer, GLOBE_FRAME_DURATION * 0.5)
+
+        # A long stall still advances only one frame and drops the backlog.
+        game._update_globe_animation(1.0)
+        self.assertEqual(game.globe_state.frame_index, 2)
+        self.assertEqual(game.globe_state.animation_timer, 0.0)
+
+        # Stepping past the last frame wraps back to the first.
+        game._update_globe_animation(GLOBE_FRAME_DURATION)
+        self.assertEqual(game.globe_state.frame_index, 0)
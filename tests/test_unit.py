@@ -35,5 +35,25 @@ class TestUnit(unittest.TestCase):
 
         # Check initial state
         self.assertFalse(unit.selected)
-        self.assertEqual(unit.path, [])
-        
\ No newline at end of file
+        self.assertEqual(list(unit.path), [])
+        self.assertFalse(unit.moving)
+
+    def test_unit_moves_across_map_edge(self):
+        """Tests that a unit takes the short way across the wrapped map edge."""
+        unit = Unit((0, 5))
+        unit.set_path([(9, 5)])
+        self.assertTrue(unit.moving)
+
+        # First update picks the next tile; moving left wraps to the far side.
+        unit.update(0.2, 10 * TILE_SIZE, 10 * TILE_SIZE)
+        self.assertEqual(unit.tile_pos, pygame.math.Vector2(9, 5))
+        self.assertGreater(unit.world_pos.x, 9 * TILE_SIZE)
+
+        # A long enough step snaps onto the target tile centre.
+        unit.update(1.0, 10 * TILE_SIZE, 10 * TILE_SIZE)
+        self.assertEqual(unit.world_pos, unit.target_world_pos)
+        self.assertEqual(list(unit.path), [])
+
+        # The next update notices there is nowhere left to go.
+        unit.update(0.1, 10 * TILE_SIZE, 10 * TILE_SIZE)
+        self.assertFalse(unit.moving)